@@ -16,7 +16,7 @@ log = logging.getLogger("skill.ccxt.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
   content: str
   is_error: bool = False
@@ -112,7 +112,7 @@ async def dispatch_tool(tool_name: str, args: dict[str, Any]) -> ToolResult:
 
     # Format result
     if result.get("success"):
-      content = json.dumps(result, indent=2)
+      content = json.dumps(result)
       return ToolResult(content=content, is_error=False)
     else:
       error_msg = result.get("error", "Unknown error")
@@ -24,7 +24,7 @@ log = logging.getLogger("skill.email.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
   content: str
   is_error: bool = False
@@ -56,6 +56,6 @@ async def gh_api(args: dict[str, Any]) -> ToolResult:
 
     if data is None:
       return ToolResult(content="(no content)")
-    return ToolResult(content=truncate(json.dumps(data, indent=2)))
+    return ToolResult(content=truncate(json.dumps(data)))
   except Exception as e:
     return log_and_format_error("gh_api", e, ErrorCategory.API)
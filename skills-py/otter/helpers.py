@@ -20,7 +20,7 @@ log = logging.getLogger("skill.otter.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
   content: str
   is_error: bool = False